@@ -7,6 +7,7 @@ from ctypes import wintypes
 from datetime import datetime
 
 from eams.models.events import ActivityEvent
+from eams.utils.tracing import traced
 
 LOGGER = logging.getLogger("eams.idle_monitor")
 
@@ -38,6 +39,7 @@ class IdleMonitor:
                 LOGGER.exception("Failed to read idle time")
         return 0
 
+    @traced("idle_monitor.poll_event", cat="collector")
     def poll_event(self) -> ActivityEvent | None:
         idle_seconds = self.get_idle_seconds()
         state = "idle" if idle_seconds >= self.idle_threshold_seconds else "active"
@@ -5,6 +5,7 @@ import platform
 from datetime import datetime
 
 from eams.models.events import ActivityEvent
+from eams.utils.tracing import traced
 
 LOGGER = logging.getLogger("eams.foreground_tracker")
 
@@ -38,6 +39,7 @@ class ForegroundTracker:
         name = psutil.Process(pid).name()
         return name, title
 
+    @traced("foreground_tracker.poll_event", cat="collector")
     def poll_event(self) -> ActivityEvent | None:
         try:
             app_name, title = self._read_foreground_windows()
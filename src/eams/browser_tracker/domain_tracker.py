@@ -7,6 +7,7 @@ from datetime import datetime
 import tldextract
 
 from eams.models.events import ActivityEvent
+from eams.utils.tracing import traced
 
 LOGGER = logging.getLogger("eams.domain_tracker")
 
@@ -26,6 +27,7 @@ class DomainTracker:
             return None
         return ".".join([p for p in [ext.domain, ext.suffix] if p])
 
+    @traced("domain_tracker.event_from_app", cat="collector")
     def event_from_app(self, app_name: str, title: str) -> ActivityEvent | None:
         try:
             domain = self.parse_domain(app_name, title)
@@ -26,5 +26,9 @@ class Settings(BaseSettings):
     poll_seconds: int = 5
     retention_days: int = 14
 
+    trace_enabled: bool = False
+    trace_max_events: int = 100_000
+    trace_path: Path | None = None
+
 
 settings = Settings()
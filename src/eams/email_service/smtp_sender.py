@@ -9,6 +9,7 @@ from pathlib import Path
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from eams.models.results import SendResult
+from eams.utils.tracing import traced
 
 LOGGER = logging.getLogger("eams.smtp_sender")
 
@@ -22,6 +23,7 @@ class SMTPSender:
         self.use_tls = use_tls
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    @traced("smtp.send_attempt", cat="email")
     def _send(self, message: EmailMessage) -> None:
         context = ssl.create_default_context()
         with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
@@ -30,13 +32,14 @@ class SMTPSender:
             smtp.login(self.username, self.password)
             smtp.send_message(message)
 
-    def send_daily_report(self, recipient: str, subject: str, html_body: str, csv_path: Path) -> SendResult:
+    @traced("smtp.send_daily_report", cat="email")
+    def send_daily_report(self, recipient: str, subject: str, html_path: Path, csv_path: Path) -> SendResult:
         msg = EmailMessage()
         msg["From"] = self.username
         msg["To"] = recipient
         msg["Subject"] = subject
         msg.set_content("Daily report attached. HTML-capable client recommended.")
-        msg.add_alternative(html_body, subtype="html")
+        msg.add_alternative(html_path.read_text(encoding="utf-8"), subtype="html")
         msg.add_attachment(csv_path.read_bytes(), maintype="text", subtype="csv", filename=csv_path.name)
 
         try:
@@ -11,6 +11,7 @@ from pathlib import Path
 from cryptography.fernet import Fernet
 
 from eams.models.events import ActivityEvent
+from eams.utils.tracing import traced, tracer
 
 LOGGER = logging.getLogger("eams.encrypted_store")
 
@@ -26,15 +27,18 @@ class EncryptedEventStore:
         return self.events_dir / f"events-{event_date.isoformat()}.log"
 
     def append_event(self, event: ActivityEvent) -> None:
-        serialized = json.dumps(event.to_dict(), separators=(",", ":")).encode()
-        token = self.fernet.encrypt(serialized)
-        digest = hmac.new(self._hmac_key, token, hashlib.sha256).hexdigest().encode()
-        line = base64.urlsafe_b64encode(token) + b"." + digest + b"\n"
-        path = self._event_file(event.timestamp.date())
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("ab") as fh:
-            fh.write(line)
-
+        with tracer.span("store.encrypt", cat="storage"):
+            serialized = json.dumps(event.to_dict(), separators=(",", ":")).encode()
+            token = self.fernet.encrypt(serialized)
+            digest = hmac.new(self._hmac_key, token, hashlib.sha256).hexdigest().encode()
+            line = base64.urlsafe_b64encode(token) + b"." + digest + b"\n"
+        with tracer.span("store.disk_write", cat="storage"):
+            path = self._event_file(event.timestamp.date())
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("ab") as fh:
+                fh.write(line)
+
+    @traced("store.read_day", cat="storage")
     def read_day(self, day: date) -> list[dict]:
         path = self._event_file(day)
         if not path.exists():
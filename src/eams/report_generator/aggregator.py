@@ -4,8 +4,10 @@ from collections import defaultdict
 from datetime import datetime
 
 from eams.models.events import ReportSummary
+from eams.utils.tracing import traced
 
 
+@traced("report.aggregate_day", cat="report")
 def aggregate_day(events: list[dict], endpoint_id: str, date_str: str) -> ReportSummary:
     app_usage = defaultdict(int)
     domain_usage = defaultdict(int)
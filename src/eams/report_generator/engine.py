@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from eams.models.events import ReportSummary
+from eams.utils.tracing import traced
+
+TEMPLATE_NAME = "daily_report.html.j2"
+TOP_APPS_LIMIT = 10
+STREAM_BUFFER_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def get_environment(templates_dir: Path, cache_dir: Path | None = None) -> Environment:
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+    else:
+        bytecode_cache = FileSystemBytecodeCache()
+    return Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=bytecode_cache,
+    )
+
+
+class ReportEngine:
+    """Renders the daily HTML report and CSV export in a single pass over a summary.
+
+    The template pulls rows from generators that write each row to the CSV as it is
+    consumed, and the HTML is streamed to disk in small buffered chunks.
+    """
+
+    def __init__(self, templates_dir: Path, cache_dir: Path | None = None) -> None:
+        self.templates_dir = templates_dir.resolve()
+        self.cache_dir = cache_dir.resolve() if cache_dir is not None else None
+
+    @property
+    def environment(self) -> Environment:
+        return get_environment(self.templates_dir, self.cache_dir)
+
+    @traced("report.render", cat="report")
+    def render(self, summary: ReportSummary, html_path: Path, csv_path: Path) -> tuple[Path, Path]:
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        template = self.environment.get_template(TEMPLATE_NAME)
+
+        with csv_path.open("w", newline="", encoding="utf-8") as csv_fh, html_path.open(
+            "w", encoding="utf-8"
+        ) as html_fh:
+            writer = csv.writer(csv_fh)
+            writer.writerow(["date", summary.date])
+            writer.writerow(["endpoint_id", summary.endpoint_id])
+            writer.writerow(["total_active_seconds", summary.total_active_seconds])
+            writer.writerow(["total_idle_seconds", summary.total_idle_seconds])
+
+            sections = [
+                _tee_section(writer, ["top_applications", "seconds"], _top_apps(summary), leading_blank=True),
+                _tee_section(
+                    writer, ["browser_domains", "seconds"], summary.browser_domain_seconds.items(), leading_blank=True
+                ),
+                _tee_section(writer, ["login_events"], summary.login_events, leading_blank=True),
+                _tee_section(writer, ["logout_events"], summary.logout_events),
+            ]
+            stream = template.stream(
+                summary=summary,
+                top_apps=sections[0],
+                domains=sections[1],
+                logins=sections[2],
+                logouts=sections[3],
+            )
+            stream.enable_buffering(STREAM_BUFFER_SIZE)
+            stream.dump(html_fh)
+
+            # Sections the template did not consume still belong in the CSV.
+            for section in sections:
+                for _ in section:
+                    pass
+        return html_path, csv_path
+
+
+def _top_apps(summary: ReportSummary) -> Iterator[tuple[str, int]]:
+    for index, item in enumerate(summary.app_usage_seconds.items()):
+        if index >= TOP_APPS_LIMIT:
+            return
+        yield item
+
+
+def _tee_section(writer, header: list[str], rows: Iterable, leading_blank: bool = False) -> Iterator:
+    if leading_blank:
+        writer.writerow([])
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(list(row) if isinstance(row, tuple) else [row])
+        yield row
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
 from eams.models.events import ReportSummary
+from eams.report_generator.engine import TEMPLATE_NAME, TOP_APPS_LIMIT, get_environment
 
 
 def render_html(summary: ReportSummary, templates_dir: Path) -> str:
-    env = Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        autoescape=select_autoescape(["html", "xml"]),
+    template = get_environment(templates_dir.resolve()).get_template(TEMPLATE_NAME)
+    return template.render(
+        summary=summary,
+        top_apps=list(summary.app_usage_seconds.items())[:TOP_APPS_LIMIT],
+        domains=summary.browser_domain_seconds.items(),
+        logins=summary.login_events,
+        logouts=summary.logout_events,
     )
-    template = env.get_template("daily_report.html.j2")
-    return template.render(summary=summary, top_apps=list(summary.app_usage_seconds.items())[:10])
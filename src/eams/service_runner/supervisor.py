@@ -15,11 +15,11 @@ from eams.email_service.smtp_sender import SMTPSender
 from eams.local_storage.encrypted_store import EncryptedEventStore
 from eams.local_storage.rotation import RotationPolicy
 from eams.report_generator.aggregator import aggregate_day
-from eams.report_generator.csv_exporter import write_csv
-from eams.report_generator.html_renderer import render_html
+from eams.report_generator.engine import ReportEngine
 from eams.scheduler.daily_scheduler import DailyScheduler
 from eams.models.events import ActivityEvent
 from eams.system_events.windows_events import SystemEventsCollector
+from eams.utils.tracing import tracer
 
 LOGGER = logging.getLogger("eams.supervisor")
 
@@ -33,6 +33,8 @@ class ServiceSupervisor:
         self.data_dir = settings.data_dir
         self.events_dir = self.data_dir / "events"
         self.reports_dir = self.data_dir / "reports"
+        self.trace_path = settings.trace_path or self.data_dir / "traces" / "eams-trace.json"
+        tracer.configure(settings.trace_enabled, settings.trace_max_events)
 
         self.storage = EncryptedEventStore(self.events_dir, settings.storage_key)
         self.rotator = RotationPolicy(settings.retention_days)
@@ -41,6 +43,10 @@ class ServiceSupervisor:
         self.domain_tracker = DomainTracker()
         self.system_events = SystemEventsCollector()
         self.scheduler = DailyScheduler()
+        self.report_engine = ReportEngine(
+            Path(__file__).resolve().parents[1] / "templates",
+            cache_dir=self.data_dir / "cache" / "templates",
+        )
         self.sender = SMTPSender(
             settings.smtp_host,
             settings.smtp_port,
@@ -51,31 +57,35 @@ class ServiceSupervisor:
 
     def enqueue_event(self, event) -> None:
         try:
-            self.queue.put_nowait(event)
+            self.queue.put_nowait((tracer.now(), event))
         except queue.Full:
             LOGGER.warning("Event queue full; dropping event")
+            if tracer.enabled:
+                now = tracer.now()
+                tracer.complete("event.dropped", now, now, cat="queue", event_type=event.event_type)
 
     def collector_loop(self) -> None:
         for event in self.system_events.startup_events():
             self.enqueue_event(event)
 
         while not self.stop_event.is_set():
-            try:
-                idle_event = self.idle_monitor.poll_event()
-                if idle_event:
-                    self.enqueue_event(idle_event)
-
-                app_event = self.app_tracker.poll_event()
-                if app_event:
-                    self.enqueue_event(app_event)
-                    domain_event = self.domain_tracker.event_from_app(
-                        app_event.payload.get("app_name", ""),
-                        app_event.payload.get("window_title", ""),
-                    )
-                    if domain_event:
-                        self.enqueue_event(domain_event)
-            except Exception:
-                LOGGER.exception("Collector loop error")
+            with tracer.span("collector.poll", cat="collector"):
+                try:
+                    idle_event = self.idle_monitor.poll_event()
+                    if idle_event:
+                        self.enqueue_event(idle_event)
+
+                    app_event = self.app_tracker.poll_event()
+                    if app_event:
+                        self.enqueue_event(app_event)
+                        domain_event = self.domain_tracker.event_from_app(
+                            app_event.payload.get("app_name", ""),
+                            app_event.payload.get("window_title", ""),
+                        )
+                        if domain_event:
+                            self.enqueue_event(domain_event)
+                except Exception:
+                    LOGGER.exception("Collector loop error")
             time.sleep(self.settings.poll_seconds)
 
         self.enqueue_event(self.system_events.shutdown_event())
@@ -83,25 +93,51 @@ class ServiceSupervisor:
     def storage_loop(self) -> None:
         while not self.stop_event.is_set() or not self.queue.empty():
             try:
-                event = self.queue.get(timeout=1)
+                enqueued_ns, event = self.queue.get(timeout=1)
             except queue.Empty:
                 continue
+            dequeued_ns = tracer.now()
             try:
                 self.storage.append_event(event)
             except Exception:
                 LOGGER.exception("Failed to persist event")
+            if tracer.enabled:
+                persisted_ns = tracer.now()
+                tracer.complete(
+                    "event.queue_wait", enqueued_ns, dequeued_ns, cat="queue", event_type=event.event_type
+                )
+                tracer.complete(
+                    "event.persist",
+                    dequeued_ns,
+                    persisted_ns,
+                    cat="storage",
+                    event_type=event.event_type,
+                    event_timestamp=event.timestamp.isoformat(),
+                    enqueue_ts_us=(enqueued_ns - tracer.origin_ns) / 1000,
+                    persist_ts_us=(persisted_ns - tracer.origin_ns) / 1000,
+                )
 
     def generate_and_send_report(self, day: date | None = None) -> None:
+        try:
+            with tracer.span("report.generate_and_send", cat="report"):
+                self._generate_and_send_report(day)
+        finally:
+            self.export_trace()
+
+    def _generate_and_send_report(self, day: date | None) -> None:
         report_day = day or date.today()
         events = self.storage.read_day(report_day)
         summary = aggregate_day(events, endpoint_id=self.settings.endpoint_id, date_str=report_day.isoformat())
 
-        csv_path = write_csv(summary, self.reports_dir / f"report-{report_day.isoformat()}.csv")
-        html_body = render_html(summary, Path(__file__).resolve().parents[1] / "templates")
+        html_path, csv_path = self.report_engine.render(
+            summary,
+            html_path=self.reports_dir / f"report-{report_day.isoformat()}.html",
+            csv_path=self.reports_dir / f"report-{report_day.isoformat()}.csv",
+        )
         result = self.sender.send_daily_report(
             recipient=self.settings.recipient_email,
             subject=f"EAMS Daily Report - {self.settings.endpoint_id} - {report_day.isoformat()}",
-            html_body=html_body,
+            html_path=html_path,
             csv_path=csv_path,
         )
 
@@ -115,10 +151,21 @@ class ServiceSupervisor:
         )
         LOGGER.info("Report send status: %s", result.success)
 
+    def export_trace(self) -> Path | None:
+        if not tracer.enabled:
+            return None
+        try:
+            path = tracer.export(self.trace_path)
+        except Exception:
+            LOGGER.exception("Failed to export trace")
+            return None
+        LOGGER.info("Trace written to %s", path)
+        return path
+
     def start(self) -> None:
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        collector = threading.Thread(target=self.collector_loop, daemon=True)
-        storer = threading.Thread(target=self.storage_loop, daemon=True)
+        collector = threading.Thread(target=self.collector_loop, name="eams-collector", daemon=True)
+        storer = threading.Thread(target=self.storage_loop, name="eams-storage", daemon=True)
         collector.start()
         storer.start()
 
@@ -136,3 +183,4 @@ class ServiceSupervisor:
             storer.join(timeout=5)
             self.rotator.prune(self.events_dir)
             self.scheduler.shutdown()
+            self.export_trace()
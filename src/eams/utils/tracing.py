@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start_ns")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> _Span:
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.complete(self._name, self._start_ns, time.perf_counter_ns(), cat=self._cat, **self._args)
+
+
+class Tracer:
+    """Collects spans in a bounded in-memory buffer and exports Chrome trace-event JSON.
+
+    Disabled by default; while disabled, ``span`` returns a shared no-op context and
+    ``complete`` returns immediately.
+    """
+
+    def __init__(self, enabled: bool = False, max_events: int = 100_000) -> None:
+        self.enabled = enabled
+        self._events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._thread_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.origin_ns = time.perf_counter_ns()
+
+    def configure(self, enabled: bool, max_events: int | None = None) -> None:
+        with self._lock:
+            if max_events is not None and max_events != self._events.maxlen:
+                self._events = deque(self._events, maxlen=max_events)
+            self.enabled = enabled
+
+    @staticmethod
+    def now() -> int:
+        return time.perf_counter_ns()
+
+    def span(self, name: str, cat: str = "eams", **args: Any):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def complete(self, name: str, start_ns: int, end_ns: int, cat: str = "eams", **args: Any) -> None:
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start_ns - self.origin_ns) / 1000,
+            "dur": max(end_ns - start_ns, 0) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": args,
+        }
+        with self._lock:
+            self._thread_names.setdefault(thread.ident, thread.name)
+            self._events.append(event)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def export(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            json.dump(self.to_chrome_trace(), fh, default=str)
+        tmp_path.replace(path)
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+
+tracer = Tracer()
+
+
+def traced(name: str, cat: str = "eams") -> Callable[[F], F]:
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with _Span(tracer, name, cat, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator